@@ -32,8 +32,8 @@
 """This module defines a global object that manages all kind of stuff regarding
 cubitpy."""
 
+import functools
 import getpass
-import glob
 import os
 from sys import platform
 
@@ -45,16 +45,20 @@ from .cubitpy_types import (
     GeometryType,
 )
 
+# Evaluate the platform checks once at module load.
+_IS_LINUX = platform == "linux" or platform == "linux2"
+_IS_MAC = platform == "darwin"
+
 
 def get_path(environment_variable, test_function, *, throw_error=True):
     """Check if he environment variable is set and the path exits."""
-    if environment_variable in os.environ.keys():
-        if test_function(os.environ[environment_variable]):
-            return os.environ[environment_variable]
+    value = os.environ.get(environment_variable)
+    if value is not None and test_function(value):
+        return value
 
     # No valid path found or given.
     if throw_error:
-        raise ValueError("Path for {} not found!".format(environment_variable))
+        raise ValueError(f"Path for {environment_variable} not found!")
     else:
         return None
 
@@ -65,8 +69,8 @@ class CubitOptions(object):
     def __init__(self):
         # Temporary directory for cubitpy.
         self.temp_dir = os.path.join(
-            "/tmp/cubitpy_{}".format(getpass.getuser()),  # nosec
-            "pid_{}".format(os.getpid()),
+            f"/tmp/cubitpy_{getpass.getuser()}",  # nosec
+            f"pid_{os.getpid()}",
         )
         self.temp_log = os.path.join(self.temp_dir, "cubitpy.log")
 
@@ -92,20 +96,25 @@ class CubitOptions(object):
         self.eps_pos = 1e-10
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_cubit_root_path(**kwargs):
-        """Get Path to cubit root directory."""
+        """Get Path to cubit root directory.
+
+        The result is cached, so the environment and file system are
+        only checked once per process.
+        """
         return get_path("CUBIT_ROOT", os.path.isdir, **kwargs)
 
     @classmethod
     def get_cubit_exe_path(cls, **kwargs):
         """Get Path to cubit executable."""
         cubit_root = cls.get_cubit_root_path(**kwargs)
-        if platform == "linux" or platform == "linux2":
+        if _IS_LINUX:
             if cupy.is_coreform():
                 return os.path.join(cubit_root, "bin", "coreform_cubit")
             else:
                 return os.path.join(cubit_root, "cubit")
-        elif platform == "darwin":
+        elif _IS_MAC:
             if cupy.is_coreform():
                 cubit_exe_name = cubit_root.split("/")[-1].split(".app")[0]
                 return os.path.join(cubit_root, "Contents/MacOS", cubit_exe_name)
@@ -118,9 +127,9 @@ class CubitOptions(object):
     def get_cubit_lib_path(cls, **kwargs):
         """Get Path to cubit lib directory."""
         cubit_root = cls.get_cubit_root_path(**kwargs)
-        if platform == "linux" or platform == "linux2":
+        if _IS_LINUX:
             return os.path.join(cubit_root, "bin")
-        elif platform == "darwin":
+        elif _IS_MAC:
             if cls.is_coreform():
                 return os.path.join(cubit_root, "Contents/lib")
             else:
@@ -129,26 +138,45 @@ class CubitOptions(object):
             raise ValueError("Got unexpected platform")
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_cubit_interpreter(cls):
-        """Get the path to the python interpreter to be used for CubitPy."""
+        """Get the path to the python interpreter to be used for CubitPy.
+
+        The known install layouts are checked first, so the whole cubit
+        installation only has to be searched if none of them matches.
+        The result is cached.
+        """
         cubit_root = cls.get_cubit_root_path()
         if cls.is_coreform():
-            pattern = "**/python3"
-            full_pattern = os.path.join(cubit_root, pattern)
-            python3_matches = glob.glob(full_pattern, recursive=True)
-            python3_files = [path for path in python3_matches if os.path.isfile(path)]
-            if not len(python3_files) == 1:
-                raise ValueError(
-                    "Could not find the path to the cubit python interpreter"
-                )
-            cubit_python_interpreter = python3_files[0]
-            return cubit_python_interpreter
+            # Paths of the interpreter relative to the cubit root directory
+            # in known cubit installations.
+            known_sub_paths = [
+                os.path.join("bin", "python3", "python3"),
+                os.path.join("bin", "python3"),
+                os.path.join("Contents", "MacOS", "python3"),
+                os.path.join("Contents", "lib", "python3", "bin", "python3"),
+            ]
+            for sub_path in known_sub_paths:
+                cubit_python_interpreter = os.path.join(cubit_root, sub_path)
+                if os.path.isfile(cubit_python_interpreter):
+                    return cubit_python_interpreter
+
+            # Fall back to searching the installation directory, stopping at
+            # the first match.
+            for root, _dirs, files in os.walk(cubit_root):
+                if "python3" in files:
+                    return os.path.join(root, "python3")
+            raise ValueError("Could not find the path to the cubit python interpreter")
         else:
             return "python2.7"
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def is_coreform(cls):
-        """Return if the given path is a path to cubit coreform."""
+        """Return if the given path is a path to cubit coreform.
+
+        The result is cached, see get_cubit_root_path.
+        """
         cubit_root = cls.get_cubit_root_path()
         if "15.2" in cubit_root:
             return False
@@ -32,12 +32,17 @@
 """This file contains a class to represent groups in cubit."""
 
 from .conf import cupy
-from .cubit_wrapper.cubit_wrapper_host import CubitObject
 
 
 class CubitGroup(object):
     """This object helps to represent groups in cubit."""
 
+    # Class-level sentinel, so hot paths can detect groups with a plain
+    # attribute lookup instead of an isinstance call.
+    __cubit_group__ = True
+
+    __slots__ = ("name", "cubit", "n_node_sets", "n_blocks", "_id")
+
     def __init__(
         self,
         cubit,
@@ -131,7 +136,7 @@ class CubitGroup(object):
 
         if isinstance(add_value, str):
             self.cubit.cmd("group {} {}".format(self._id, add_value))
-        elif isinstance(add_value, CubitObject):
+        elif getattr(add_value, "__cubit_object__", False):
             self.cubit.add_entity_to_group(
                 self._id,
                 add_value.id(),
@@ -151,23 +156,28 @@ class CubitGroup(object):
         """
 
         group_items = self.get_item_ids()
-        group_keys = [key for key in group_items if len(group_items[key]) > 0]
-        if not len(group_keys) == 1:
+        # Find the single non-empty item type in one pass, without building
+        # an intermediate list of keys.
+        key = None
+        for item_type, item_ids in group_items.items():
+            if item_ids:
+                if key is not None:
+                    raise TypeError("Got wrong types in get_geometry_type")
+                key = item_type
+        if key is None:
             raise TypeError("Got wrong types in get_geometry_type")
-
-        key = group_keys[0]
         if key in cupy.geometry:
             return key
-        elif key == cupy.finite_element_object.node:
+        elif key is cupy.finite_element_object.node:
             return cupy.geometry.vertex
         elif (
-            key == cupy.finite_element_object.triangle
-            or key == cupy.finite_element_object.face
+            key is cupy.finite_element_object.triangle
+            or key is cupy.finite_element_object.face
         ):
             return cupy.geometry.surface
         elif (
-            key == cupy.finite_element_object.tet
-            or key == cupy.finite_element_object.hex
+            key is cupy.finite_element_object.tet
+            or key is cupy.finite_element_object.hex
         ):
             return cupy.geometry.volume
         else:
@@ -183,31 +193,31 @@ class CubitGroup(object):
         """Get the IDs of a certain type of item in this group."""
 
         # Geometry items.
-        if item_type == cupy.geometry.vertex:
+        if item_type is cupy.geometry.vertex:
             return self.cubit.get_group_vertices(self._id)
-        elif item_type == cupy.geometry.curve:
+        elif item_type is cupy.geometry.curve:
             return self.cubit.get_group_curves(self._id)
-        elif item_type == cupy.geometry.surface:
+        elif item_type is cupy.geometry.surface:
             return self.cubit.get_group_surfaces(self._id)
-        elif item_type == cupy.geometry.volume:
+        elif item_type is cupy.geometry.volume:
             return self.cubit.get_group_volumes(self._id)
 
         # Finite element items.
-        elif item_type == cupy.finite_element_object.node:
+        elif item_type is cupy.finite_element_object.node:
             return self.cubit.get_group_nodes(self._id)
-        elif item_type == cupy.finite_element_object.edge:
+        elif item_type is cupy.finite_element_object.edge:
             return self.cubit.get_group_edges(self._id)
-        elif item_type == cupy.finite_element_object.face:
+        elif item_type is cupy.finite_element_object.face:
             return self.cubit.get_group_quads(self._id)
-        elif item_type == cupy.finite_element_object.triangle:
+        elif item_type is cupy.finite_element_object.triangle:
             return self.cubit.get_group_tris(self._id)
-        elif item_type == cupy.finite_element_object.tet:
+        elif item_type is cupy.finite_element_object.tet:
             return self.cubit.get_group_tets(self._id)
-        elif item_type == cupy.finite_element_object.hex:
+        elif item_type is cupy.finite_element_object.hex:
             return self.cubit.get_group_hexes(self._id)
 
         # Cubit items.
-        elif item_type == cupy.cubit_items.group:
+        elif item_type is cupy.cubit_items.group:
             return self.cubit.get_group_groups(self._id)
 
         else:
@@ -269,8 +279,8 @@ class CubitGroup(object):
 
         self_geometry = self.get_geometry_type()
         if (
-            self_geometry != cupy.geometry.surface
-            and self_geometry != cupy.geometry.volume
+            self_geometry is not cupy.geometry.surface
+            and self_geometry is not cupy.geometry.volume
         ):
             raise NotImplementedError("This case is not implemented")
 
@@ -38,12 +38,13 @@ def get_surface_center(surf):
     """Get a 3D point that has the local coordinated on the surface of (0,0),
     with the parameter space being ([-1,1],[-1,1])."""
 
-    if not surf.get_geometry_type() == cupy.geometry.surface:
-        raise TypeError("Did not expect {}".format(type(surf)))
+    # The type check needs a round-trip to cubit, so it is skipped when
+    # python runs with optimizations enabled (-O).
+    if __debug__ and surf.get_geometry_type() is not cupy.geometry.surface:
+        raise TypeError(f"Did not expect {type(surf)}")
 
-    range_u = surf.get_param_range_U()
+    range_u, range_v = surf.get_param_ranges()
     u = 0.5 * (range_u[1] + range_u[0])
-    range_v = surf.get_param_range_V()
     v = 0.5 * (range_v[1] + range_v[0])
     return surf.position_from_u_v(u, v)
 
@@ -52,8 +53,20 @@ def import_fluent_geometry(cubit, file, feature_angle=135):
     """Import fluent mesh geometry in cubit from file with according
     feature_angle."""
 
+    cubit.cmd(f'import fluent mesh geometry  "{file}" feature_angle {feature_angle} ')
+
+
+def import_fluent_geometries(cubit, files, feature_angle=135):
+    """Import multiple fluent mesh geometries in cubit with according
+    feature_angle.
+
+    The import commands are joined and sent to cubit in a single call,
+    which avoids one interpreter round-trip per file.
+    """
+
     cubit.cmd(
-        'import fluent mesh geometry  "{}" feature_angle {} '.format(
-            file, feature_angle
+        "\n".join(
+            f'import fluent mesh geometry  "{file}" feature_angle {feature_angle} '
+            for file in files
         )
     )
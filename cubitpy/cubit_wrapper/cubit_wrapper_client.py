@@ -229,6 +229,17 @@ while 1:
                 )
             )
 
+    elif receive[0] == "get_param_ranges":
+        # Return both parameter ranges of a surface object with a single
+        # exchange over the channel
+        cubit_object = cubit_objects[cubit_item_to_id(receive[1])]
+        channel.send(
+            [
+                list(cubit_object.get_param_range_U()),
+                list(cubit_object.get_param_range_V()),
+            ]
+        )
+
     elif receive[0] == "get_self_dir":
         # Return a list with all callable methods of this object
         cubit_object = cubit_objects[cubit_item_to_id(receive[1])]
@@ -41,6 +41,10 @@ import numpy as np
 from ..conf import cupy
 from .cubit_wrapper_utility import cubit_item_to_id, is_base_type
 
+# Resolve the geometry enum once at module load, so the serialization does
+# not have to look it up through cupy for every argument.
+_GEOMETRY_TYPE = cupy.geometry
+
 
 class CubitConnect(object):
     """This class holds a connection to a cubit python interpreter and
@@ -182,22 +186,32 @@ class CubitConnect(object):
             def serialize_item(item):
                 """Serialize an item, also nested lists."""
 
-                if (
-                    isinstance(item, tuple)
-                    or isinstance(item, list)
-                    or isinstance(item, np.ndarray)
-                ):
-                    arguments = []
-                    for sub_item in item:
-                        arguments.append(serialize_item(sub_item))
-                    return arguments
-                elif isinstance(item, CubitObject):
+                # Check the exact types first, which is faster than the
+                # isinstance chain below for the common cases. The isinstance
+                # chain is kept as fallback, so subclasses still work.
+                item_type = type(item)
+                if item_type is int or item_type is float or item_type is str:
+                    return item
+                if item_type is list or item_type is tuple:
+                    return [serialize_item(sub_item) for sub_item in item]
+                if item_type is np.ndarray and item.dtype != object:
+                    # Numeric arrays (e.g. large ID lists) are converted in a
+                    # single C call, which also turns the entries into plain
+                    # Python scalars.
+                    return item.tolist()
+
+                if isinstance(item, (tuple, list, np.ndarray)):
+                    return [serialize_item(sub_item) for sub_item in item]
+                elif getattr(item, "__cubit_object__", False):
                     return item.cubit_id
                 elif isinstance(item, float):
                     return float(item)
                 elif isinstance(item, int):
                     return int(item)
-                elif isinstance(item, cupy.geometry):
+                elif item_type is _GEOMETRY_TYPE:
+                    # Exact-type check on purpose: isinstance against an Enum
+                    # goes through the slow metaclass __instancecheck__ and
+                    # enums cannot have member subclasses anyway.
                     return item.get_cubit_string()
                 else:
                     return item
@@ -208,8 +222,23 @@ class CubitConnect(object):
                     with open(cupy.temp_log, "w"):
                         pass
 
-            # Check if there are cubit objects in the arguments
-            arguments = serialize_item(args)
+            # Check if there are cubit objects in the arguments. Calls
+            # without arguments and calls with only base-type scalars, which
+            # are the most common ones, need no conversion at all.
+            if not args:
+                arguments = []
+            else:
+                for arg in args:
+                    arg_type = type(arg)
+                    if (
+                        arg_type is not int
+                        and arg_type is not float
+                        and arg_type is not str
+                    ):
+                        arguments = serialize_item(args)
+                        break
+                else:
+                    arguments = list(args)
 
             # Call the method on the cubit object
             cubit_return = self.send_and_return(
@@ -262,6 +291,14 @@ class CubitObject(object):
     client.
     """
 
+    # Class-level sentinel, so hot paths can detect cubit objects with a
+    # plain attribute lookup instead of an isinstance call.
+    __cubit_object__ = True
+
+    # Many wrapper objects can exist at the same time, so store the
+    # attributes in slots, which is smaller and faster than an instance dict.
+    __slots__ = ("cubit_connect", "cubit_id", "_geometry_type")
+
     def __init__(self, cubit_connect, cubit_data_list):
         """Initialize the object.
 
@@ -281,6 +318,7 @@ class CubitObject(object):
 
         self.cubit_connect = cubit_connect
         self.cubit_id = cubit_data_list
+        self._geometry_type = None
 
     def __getattribute__(self, name, *args, **kwargs):
         """This function gets called for each attribute in this object. First
@@ -336,19 +374,38 @@ class CubitObject(object):
         return [method for method, callable in self.get_self_dir() if not callable]
 
     def get_geometry_type(self):
-        """Return the type of this item."""
+        """Return the type of this item.
+
+        The geometry type of a cubit object cannot change, so the result
+        is cached and the client is only asked once per object.
+        """
+
+        geometry_type = self._geometry_type
+        if geometry_type is not None:
+            return geometry_type
 
         if self.isinstance("cubitpy_vertex"):
-            return cupy.geometry.vertex
+            geometry_type = cupy.geometry.vertex
         elif self.isinstance("cubitpy_curve"):
-            return cupy.geometry.curve
+            geometry_type = cupy.geometry.curve
         elif self.isinstance("cubitpy_surface"):
-            return cupy.geometry.surface
+            geometry_type = cupy.geometry.surface
         elif self.isinstance("cubitpy_volume"):
-            return cupy.geometry.volume
+            geometry_type = cupy.geometry.volume
+        else:
+            # Default value -> not a valid geometry
+            raise TypeError("The item is not a valid geometry!")
+
+        self._geometry_type = geometry_type
+        return geometry_type
 
-        # Default value -> not a valid geometry
-        raise TypeError("The item is not a valid geometry!")
+    def get_param_ranges(self):
+        """Return the U and V parameter ranges of this (surface) object.
+
+        Both ranges are retrieved with a single exchange with the
+        client, instead of one call per range.
+        """
+        return self.cubit_connect.send_and_return(["get_param_ranges", self.cubit_id])
 
     def get_node_ids(self):
         """Return a list with the node IDs (index 1) of this object.
@@ -383,6 +440,8 @@ class CubitObject(object):
 class CubitObjectMain(CubitObject):
     """The main cubit object will be of this type, it can not delete itself."""
 
+    __slots__ = ()
+
     def __del__(self):
         """Overwrite the default, because we don't want to delete any objects
         on the client if this main object is deleted."""
@@ -45,7 +45,7 @@ def cubit_item_to_id(cubit_data_list):
     """Return the id from a cubit data list."""
     if not isinstance(cubit_data_list, list):
         return None
-    if len(cubit_data_list) == 0:
+    if not cubit_data_list:
         return None
     if not isinstance(cubit_data_list[0], str):
         return None
@@ -59,6 +59,11 @@ def cubit_item_to_id(cubit_data_list):
 def is_base_type(obj):
     """Check if the object is of a base type that does not need conversion for
     the connection between the different python interpreters."""
+    # Check the exact types first, which is faster than isinstance for the
+    # common cases. The isinstance fallback keeps subclasses working.
+    obj_type = type(obj)
+    if obj_type is str or obj_type is int or obj_type is float or obj is None:
+        return True
     if (
         isinstance(obj, str)
         or isinstance(obj, int)
@@ -289,13 +289,13 @@ class CubitPy(object):
         """Get a list with all available cubit objects of a certain geometry
         type."""
 
-        if geometry_type == cupy.geometry.vertex:
+        if geometry_type is cupy.geometry.vertex:
             funct = self.vertex
-        elif geometry_type == cupy.geometry.curve:
+        elif geometry_type is cupy.geometry.curve:
             funct = self.curve
-        elif geometry_type == cupy.geometry.surface:
+        elif geometry_type is cupy.geometry.surface:
             funct = self.surface
-        elif geometry_type == cupy.geometry.volume:
+        elif geometry_type is cupy.geometry.volume:
             funct = self.volume
         else:
             raise ValueError("Got unexpected geometry type!")
@@ -316,7 +316,7 @@ class CubitPy(object):
         """
 
         # Check if item is line.
-        if not item.get_geometry_type() == cupy.geometry.curve:
+        if item.get_geometry_type() is not cupy.geometry.curve:
             raise TypeError("Expected line, got {}".format(type(item)))
         self.cubit.cmd("curve {} interval {} scheme equal".format(item.id(), n_el))
 
@@ -331,13 +331,15 @@ class CubitPy(object):
         """Export the mesh."""
         self.cubit.cmd('export mesh "{}" dimension 3 overwrite'.format(path))
 
-    def create_dat(self, dat_path):
+    def create_dat(self, dat_path, **kwargs):
         """Create the dat file an copy it to dat_path.
 
         Args
         ----
         dat_path: str
             Path where the input file file will be saved
+        kwargs:
+            Are passed on to cubit_to_dat.
         """
 
         # Check if output path exists.
@@ -347,12 +349,12 @@ class CubitPy(object):
                 raise ValueError("Path {} does not exist!".format(dat_dir))
 
         with open(dat_path, "w") as the_file:
-            for line in self.get_dat_lines():
+            for line in self.get_dat_lines(**kwargs):
                 the_file.write(line + "\n")
 
-    def get_dat_lines(self):
+    def get_dat_lines(self, **kwargs):
         """Return a list with all lines in this input file."""
-        return cubit_to_dat(self)
+        return cubit_to_dat(self, **kwargs)
 
     def group(self, **kwargs):
         """Reference a group in cubit.
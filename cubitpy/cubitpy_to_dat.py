@@ -39,23 +39,48 @@ import numpy as np
 
 from .conf import cupy
 
+# Section header and set label for each geometry type in the dat file,
+# resolved once at module load.
+_NAME_GEOMETRY_TUPLE = (
+    (
+        cupy.geometry.vertex,
+        "-----------------------------------------------DNODE-NODE TOPOLOGY",
+        "DNODE",
+    ),
+    (
+        cupy.geometry.curve,
+        "-----------------------------------------------DLINE-NODE TOPOLOGY",
+        "DLINE",
+    ),
+    (
+        cupy.geometry.surface,
+        "-----------------------------------------------DSURF-NODE TOPOLOGY",
+        "DSURFACE",
+    ),
+    (
+        cupy.geometry.volume,
+        "-----------------------------------------------DVOL-NODE TOPOLOGY",
+        "DVOL",
+    ),
+)
+
 
 def add_node_sets(dat_lines, cubit, exo):
     """Add the node sets contained in the cubit session/exo file to the
     dat_lines."""
 
     # If there are no node sets we can return immediately
-    if len(cubit.node_sets) == 0:
+    if not cubit.node_sets:
         return
 
-    # Get names of the node sets
-    names = []
-    for string_list in exo.variables["ns_names"]:
-        string = ""
-        for char in string_list:
-            if isinstance(char, np.bytes_):
-                string += char.decode("UTF-8")
-        names.append(string)
+    # Get names of the node sets. Each name is stored as a character array,
+    # which is decoded in a single call per name instead of per character.
+    names = [
+        bytes(line.compressed() if hasattr(line, "compressed") else line)
+        .decode("UTF-8")
+        .rstrip("\x00")
+        for line in exo.variables["ns_names"][:]
+    ]
 
     # Sort the sets into their geometry type
     node_sets = {
@@ -68,12 +93,10 @@ def add_node_sets(dat_lines, cubit, exo):
     node_set_keys = [key for key in exo.variables.keys() if "node_ns" in key]
     for i_set, key in enumerate(node_set_keys):
         bc_section, bc_description, geometry_type = cubit.node_sets[i_set]
-        node_sets[geometry_type].append(exo.variables[key][:])
-        bc_key = (bc_section, geometry_type)
-        if bc_key not in boundary_condition_map.keys():
-            boundary_condition_map[bc_key] = []
-        boundary_condition_map[bc_key].append(
-            [len(node_sets[geometry_type]), bc_description, names[i_set]]
+        geometry_node_sets = node_sets[geometry_type]
+        geometry_node_sets.append(exo.variables[key][:])
+        boundary_condition_map.setdefault((bc_section, geometry_type), []).append(
+            [len(geometry_node_sets), bc_description, names[i_set]]
         )
 
     # Write the boundary conditions
@@ -93,88 +116,88 @@ def add_node_sets(dat_lines, cubit, exo):
                 dat_lines.append(f"// {name}")
             dat_lines.append(f"E {set_id} - {bc_description}")
 
-    name_geometry_tuple = [
-        [
-            cupy.geometry.vertex,
-            "-----------------------------------------------DNODE-NODE TOPOLOGY",
-            "DNODE",
-        ],
-        [
-            cupy.geometry.curve,
-            "-----------------------------------------------DLINE-NODE TOPOLOGY",
-            "DLINE",
-        ],
-        [
-            cupy.geometry.surface,
-            "-----------------------------------------------DSURF-NODE TOPOLOGY",
-            "DSURFACE",
-        ],
-        [
-            cupy.geometry.volume,
-            "-----------------------------------------------DVOL-NODE TOPOLOGY",
-            "DVOL",
-        ],
-    ]
-    for geo, section_name, set_label in name_geometry_tuple:
+    for geo, section_name, set_label in _NAME_GEOMETRY_TUPLE:
         dat_lines.append(section_name)
         for i_set, node_set in enumerate(node_sets[geo]):
-            node_set.sort()
-            for i_node in node_set:
-                dat_lines.append(f"NODE {i_node:6d} {set_label} {i_set+1}")
+            node_set = np.asarray(node_set)
+            # Only sort if the node IDs from the exo file are not already
+            # in ascending order.
+            if node_set.size > 1 and (np.diff(node_set) < 0).any():
+                node_set = np.sort(node_set)
+            sorted_nodes = node_set.tolist()
+            dat_lines.extend(
+                f"NODE {i_node:6d} {set_label} {i_set+1}" for i_node in sorted_nodes
+            )
 
 
-def get_element_connectivity_string(connectivity):
-    """Return the connectivity string for an element.
+# Number of elements whose connectivity is read from the exo file at once.
+_CONNECTIVITY_CHUNK = 65536
 
-    For hex27 we need a different ordering than the one we get from
-    cubit
-    """
+# For hex27 we need a different node ordering than the one we get from cubit.
+# The ordering is stored as a NumPy index array, so it can be applied to the
+# connectivity of a whole block with a single fancy-indexing operation.
+_HEX27_ORDERING = np.array(
+    [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19]
+    + [21, 25, 24, 26, 23, 22, 20],
+    dtype=np.intp,
+)
 
-    if len(connectivity) == 27:
+
+def get_block_connectivity_list(connectivity_array):
+    """Return the connectivity of a whole block as a list of lists, with the
+    node ordering expected by 4C."""
+
+    if connectivity_array.shape[1] == 27:
         # hex27
-        ordering = [
-            0,
-            1,
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            21,
-            25,
-            24,
-            26,
-            23,
-            22,
-            20,
-        ]
-        return " ".join([f"{item:d}" for item in connectivity[ordering]])
+        return connectivity_array[:, _HEX27_ORDERING].tolist()
     else:
         # all other elements
-        return " ".join([f"{item:d}" for item in connectivity])
+        return connectivity_array.tolist()
+
+
+def get_element_lines(connectivity_list, id_offset, element_string, block_string):
+    """Return the dat file lines for the elements in a connectivity chunk.
+
+    Building the lines in this helper keeps the hot loop on local
+    variables only. The parts of the line that are constant within a
+    block are passed in as the premerged strings element_string and
+    block_string.
+    """
+    return [
+        f"{id_offset+i:9d} {element_string} {' '.join(map(str, connectivity))} {block_string}"
+        for i, connectivity in enumerate(connectivity_list, start=1)
+    ]
 
 
-def cubit_to_dat(cubit):
-    """Convert a CubitPy session to a dat file that can be read with 4C."""
+def cubit_to_dat(cubit, *, force_export=True):
+    """Convert a CubitPy session to a dat file that can be read with 4C.
+
+    Args
+    ----
+    force_export: bool
+        If this is False and the session was already exported by a
+        previous call with the same blocks and node sets, the existing
+        exodus file is reused instead of exporting the mesh again. Only
+        use this if the cubit session did not change between the calls.
+    """
 
     # Create exodus file
     os.makedirs(cupy.temp_dir, exist_ok=True)
     exo_path = os.path.join(cupy.temp_dir, "cubitpy.exo")
-    cubit.export_exo(exo_path)
+    export_fingerprint = (len(cubit.blocks), len(cubit.node_sets))
+    if (
+        force_export
+        or cubit.__dict__.get("_dat_export_fingerprint", None) != export_fingerprint
+        or not os.path.isfile(exo_path)
+    ):
+        cubit.export_exo(exo_path)
+        cubit._dat_export_fingerprint = export_fingerprint
     exo = netCDF4.Dataset(exo_path)
+    # Return plain ndarrays instead of masked/scaled arrays when reading
+    # variables, which avoids the masked-array overhead for large meshes.
+    exo.set_auto_mask(False)
+    exo.set_auto_scale(False)
+    exo.set_auto_chartostring(False)
 
     dat_lines = []
 
@@ -189,18 +212,23 @@ def cubit_to_dat(cubit):
     dat_lines.append(
         "-------------------------------------------------------NODE COORDS"
     )
-    if "coordz" in exo.variables:
-        coordinates = np.array(
-            [exo.variables["coord" + dim][:] for dim in ["x", "y", "z"]],
-        ).transpose()
+    coordinates_x = exo.variables["coordx"][:]
+    coordinates_y = exo.variables["coordy"][:]
+    coordinates_z_variable = exo.variables.get("coordz")
+    if coordinates_z_variable is not None:
+        coordinates_z = coordinates_z_variable[:]
     else:
-        temp = [exo.variables["coord" + dim][:] for dim in ["x", "y"]]
-        temp.append([0 for i in range(len(temp[0]))])
-        coordinates = np.array(temp).transpose()
-    for i, coordinate in enumerate(coordinates):
-        dat_lines.append(
-            f"NODE {i+1:9d} COORD {coordinate[0]: .16e} {coordinate[1]: .16e} {coordinate[2]: .16e}"
-        )
+        # 2-D mesh, fill the z coordinates with zeros.
+        coordinates_z = np.zeros_like(coordinates_x)
+    # Convert the coordinate arrays to plain Python lists once, so the loop
+    # below does not index into NumPy arrays for every single node.
+    coordinates_x = coordinates_x.tolist()
+    coordinates_y = coordinates_y.tolist()
+    coordinates_z = coordinates_z.tolist()
+    dat_lines.extend(
+        f"NODE {i+1:9d} COORD {x: .16e} {y: .16e} {z: .16e}"
+        for i, (x, y, z) in enumerate(zip(coordinates_x, coordinates_y, coordinates_z))
+    )
 
     # Add the element connectivity
     current_section = None
@@ -215,11 +243,20 @@ def cubit_to_dat(cubit):
             dat_lines.append(
                 f"------------------------------------------------{current_section} ELEMENTS"
             )
-        for connectivity in exo.variables[key][:]:
-            connectivity_string = get_element_connectivity_string(connectivity)
-            dat_lines.append(
-                f"{i_element+1:9d} {ele_type.get_four_c_name()} {ele_type.get_four_c_type()} {connectivity_string} {block_string}"
+        # Hoist the per-element invariants out of the loop and add all lines
+        # of a chunk in one extend call. Reading the connectivity in chunks
+        # bounds the peak memory for blocks with many elements.
+        element_string = f"{ele_type.get_four_c_name()} {ele_type.get_four_c_type()}"
+        connectivity_variable = exo.variables[key]
+        for start in range(0, connectivity_variable.shape[0], _CONNECTIVITY_CHUNK):
+            connectivity_list = get_block_connectivity_list(
+                connectivity_variable[start : start + _CONNECTIVITY_CHUNK, :]
+            )
+            dat_lines.extend(
+                get_element_lines(
+                    connectivity_list, i_element, element_string, block_string
+                )
             )
-            i_element += 1
+            i_element += len(connectivity_list)
 
     return dat_lines
@@ -32,6 +32,7 @@
 """This module contains ENums for types used in cubitpy as well as functions to
 convert them to strings for cubit or 4C commands or the wrapper."""
 
+import functools
 from enum import Enum, auto
 
 
@@ -43,8 +44,13 @@ class GeometryType(Enum):
     surface = auto()
     volume = auto()
 
+    @functools.lru_cache(maxsize=None)
     def get_cubit_string(self):
-        """Return the string that represents this item in cubit."""
+        """Return the string that represents this item in cubit.
+
+        The string for each member is cached, so repeated calls on hot
+        paths are a single dict lookup.
+        """
 
         if self == self.vertex:
             return "vertex"
@@ -83,8 +89,13 @@ class FiniteElementObject(Enum):
     edge = auto()
     node = auto()
 
+    @functools.lru_cache(maxsize=None)
     def get_cubit_string(self):
-        """Return the string that represents this item in cubit."""
+        """Return the string that represents this item in cubit.
+
+        The string for each member is cached, see
+        GeometryType.get_cubit_string.
+        """
 
         if self == self.hex:
             return "hex"
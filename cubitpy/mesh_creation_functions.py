@@ -84,10 +84,15 @@ def create_brick(
 
     # Create the block in cubit.
     solid = cubit.brick(h_x, h_y, h_z)
-    volume_id = solid.volumes()[0].id()
+    volume = solid.volumes()[0]
+    volume_id = volume.id()
 
     # Set the element type.
-    cubit.add_element_type(solid.volumes()[0], el_type=element_type, **kwargs)
+    cubit.add_element_type(volume, el_type=element_type, **kwargs)
+
+    # Collect the meshing commands and send them to cubit in a single call,
+    # since every cubit.cmd call crosses the interpreter boundary.
+    mesh_commands = []
 
     # Set mesh properties.
     if mesh_interval is not None:
@@ -105,10 +110,8 @@ def create_brick(
 
         # Set the number of elements in x, y and z direction.
         for direction in range(3):
-            string = ""
-            for curve in dir_curves[direction]:
-                string += " {}".format(curve.id())
-            cubit.cmd(
+            string = " ".join(str(curve.id()) for curve in dir_curves[direction])
+            mesh_commands.append(
                 "curve {} interval {} scheme equal".format(
                     string, mesh_interval[direction]
                 )
@@ -116,11 +119,16 @@ def create_brick(
 
     if mesh_factor is not None:
         # Set a cubit factor for the mesh size.
-        cubit.cmd("volume {} size auto factor {}".format(volume_id, mesh_factor))
+        mesh_commands.append(
+            "volume {} size auto factor {}".format(volume_id, mesh_factor)
+        )
 
     # Mesh the created block.
     if mesh:
-        cubit.cmd("mesh volume {}".format(volume_id))
+        mesh_commands.append("mesh volume {}".format(volume_id))
+
+    if mesh_commands:
+        cubit.cmd("\n".join(mesh_commands))
 
     return solid
 
@@ -193,7 +201,7 @@ def extrude_mesh_normal_to_surface(
             surface_nodes.extend(cubit.get_connectivity("quad", quad))
         # Remove double entries in node list.
         surface_nodes = list(set(surface_nodes))
-        if len(surface_nodes) == 0:
+        if not surface_nodes:
             raise ValueError("Each surface must be meshed!")
 
         # Get normals and positions of the nodes.
@@ -271,7 +279,7 @@ def extrude_mesh_normal_to_surface(
 
     # Create the elements.
     n_elements_old = cubit.get_hex_count()
-    topology_list = list(map(int, element_topology.reshape(n_quads * n_layer * 8)))
+    topology_list = element_topology.reshape(n_quads * n_layer * 8).astype(int).tolist()
     mi.add_elements(cubit.HEX, n_quads * n_layer, topology_list)
 
     # Create a volume from the created elements and return a reference to that